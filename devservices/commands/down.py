@@ -123,7 +123,7 @@ def _bring_down_dependency(
     # TODO: Get rid of these constants, we need a smarter way to determine the containers being brought down
     for dependency in cmd.services:
         status.info(f"Stopping {dependency}")
-    return run_cmd(cmd.full_command, current_env)
+    return run_cmd(cmd.full_command, current_env, capture_stdout=False)
 
 
 def _down(
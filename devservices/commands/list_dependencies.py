@@ -53,6 +53,10 @@ def list_dependencies(args: Namespace) -> None:
         console.info(f"No dependencies found for {service.name}")
         return
 
-    console.info(f"Dependencies of {service.name}:")
-    for dependency_key, dependency_info in dependencies.items():
-        console.info("- " + dependency_key + ": " + dependency_info.description)
+    # Print everything at once, since each console write flushes stdout
+    lines = [f"Dependencies of {service.name}:"]
+    lines.extend(
+        "- " + dependency_key + ": " + dependency_info.description
+        for dependency_key, dependency_info in dependencies.items()
+    )
+    console.info("\n".join(lines))
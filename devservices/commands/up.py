@@ -116,7 +116,7 @@ def _bring_up_dependency(
 ) -> subprocess.CompletedProcess[str]:
     for dependency in cmd.services:
         status.info(f"Starting {dependency}")
-    return run_cmd(cmd.full_command, current_env)
+    return run_cmd(cmd.full_command, current_env, capture_stdout=False)
 
 
 def _up(
@@ -155,24 +155,31 @@ def _up(
 
     containers_to_check = []
     with concurrent.futures.ThreadPoolExecutor() as dependency_executor:
-        futures = [
-            dependency_executor.submit(_bring_up_dependency, cmd, current_env, status)
-            for cmd in docker_compose_commands
-        ]
-        for future in concurrent.futures.as_completed(futures):
+        up_futures = {
+            dependency_executor.submit(
+                _bring_up_dependency, cmd, current_env, status
+            ): index
+            for index, cmd in enumerate(docker_compose_commands)
+        }
+        # Look up each project's containers as soon as it is up, while other projects are still starting
+        container_name_futures = {}
+        for future in concurrent.futures.as_completed(up_futures):
             _ = future.result()
-
-    for cmd in docker_compose_commands:
-        try:
-            container_names = get_container_names_for_project(
-                cmd.project_name, cmd.config_path
-            )
-            containers_to_check.extend(container_names)
-        except DockerComposeError as dce:
-            status.failure(
-                f"Failed to get containers to healthcheck for {cmd.project_name}: {dce.stderr}"
+            index = up_futures[future]
+            cmd = docker_compose_commands[index]
+            container_name_futures[index] = dependency_executor.submit(
+                get_container_names_for_project, cmd.project_name, cmd.config_path
             )
-            exit(1)
+
+        for index, cmd in enumerate(docker_compose_commands):
+            try:
+                container_names = container_name_futures[index].result()
+                containers_to_check.extend(container_names)
+            except DockerComposeError as dce:
+                status.failure(
+                    f"Failed to get containers to healthcheck for {cmd.project_name}: {dce.stderr}"
+                )
+                exit(1)
     try:
         check_all_containers_healthy(status, containers_to_check)
     except ContainerHealthcheckFailedError as e:
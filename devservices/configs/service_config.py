@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from dataclasses import fields
+from functools import lru_cache
 
 import yaml
 
@@ -12,10 +13,16 @@ from devservices.exceptions import ConfigNotFoundError
 from devservices.exceptions import ConfigParseError
 from devservices.exceptions import ConfigValidationError
 
+try:
+    # Prefer the libyaml-backed loader, which is much faster than the pure Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 VALID_VERSIONS = [0.1]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RemoteConfig:
     repo_name: str
     branch: str
@@ -23,13 +30,13 @@ class RemoteConfig:
     mode: str = "default"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Dependency:
     description: str
     remote: RemoteConfig | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceConfig:
     version: float
     service_name: str
@@ -57,22 +64,44 @@ class ServiceConfig:
         for mode, services in self.modes.items():
             if not isinstance(services, list):
                 raise ConfigValidationError(f"Services in mode '{mode}' must be a list")
-            for service in services:
-                if service not in self.dependencies:
-                    raise ConfigValidationError(
-                        f"Service '{service}' in mode '{mode}' is not defined in dependencies"
-                    )
+            undefined_services = set(services).difference(self.dependencies)
+            if not undefined_services:
+                continue
+            # Report the first undefined service in the order it is listed
+            service = next(
+                service for service in services if service in undefined_services
+            )
+            raise ConfigValidationError(
+                f"Service '{service}' in mode '{mode}' is not defined in dependencies"
+            )
 
 
 def load_service_config_from_file(repo_path: str) -> ServiceConfig:
     config_path = os.path.join(repo_path, DEVSERVICES_DIR_NAME, CONFIG_FILE_NAME)
-    if not os.path.exists(config_path):
+    try:
+        stat = os.stat(config_path)
+    except OSError as e:
+        # Like os.path.exists, treat any unreachable path (missing, not a
+        # directory, no permission) as a repo without a config
         raise ConfigNotFoundError(
             f"No devservices configuration found in {config_path}"
-        )
-    with open(config_path, "r", encoding="utf-8") as stream:
+        ) from e
+    return _load_service_config(config_path, stat.st_mtime_ns, stat.st_size)
+
+
+# Keyed by modification time and size so that an edited config is parsed again
+@lru_cache(maxsize=64)
+def _load_service_config(config_path: str, mtime_ns: int, size: int) -> ServiceConfig:
+    try:
+        # Hand libyaml the raw bytes so it decodes them itself
+        stream = open(config_path, "rb")
+    except OSError as e:
+        raise ConfigNotFoundError(
+            f"No devservices configuration found in {config_path}"
+        ) from e
+    with stream:
         try:
-            config = yaml.safe_load(stream)
+            config = yaml.load(stream, Loader=SafeLoader)
         except yaml.YAMLError as yml_error:
             raise ConfigParseError(
                 f"Error parsing config file: {yml_error}"
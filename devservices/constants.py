@@ -28,6 +28,7 @@ DEVSERVICES_RELEASES_URL = (
 DOCKER_COMPOSE_DOWNLOAD_URL = "https://github.com/docker/compose/releases/download"
 DEVSERVICES_DOWNLOAD_URL = "https://github.com/getsentry/devservices/releases/download"
 BINARY_PERMISSIONS = 0o755
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 MAX_LOG_LINES = "100"
 LOGGER_NAME = "devservices"
 DOCKER_NETWORK_NAME = "devservices"
@@ -39,3 +40,4 @@ DEVSERVICES_LATEST_VERSION_CACHE_FILE = os.path.join(
 DEVSERVICES_LATEST_VERSION_CACHE_TTL = timedelta(minutes=15)
 HEALTHCHECK_TIMEOUT = 45
 HEALTHCHECK_INTERVAL = 5
+HEALTHCHECK_INITIAL_INTERVAL = 0.5
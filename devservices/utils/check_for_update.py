@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import tempfile
 from datetime import datetime
 from datetime import timedelta
 from urllib.request import urlopen
@@ -37,8 +38,21 @@ def _get_cached_version() -> str | None:
 
 
 def _set_cached_version(latest_version: str) -> None:
-    with open(DEVSERVICES_LATEST_VERSION_CACHE_FILE, "w", encoding="utf-8") as f:
-        f.write(latest_version)
+    # Write to a temporary file and atomically swap it in so that a concurrent
+    # devservices process never reads a truncated version
+    f = tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=os.path.dirname(DEVSERVICES_LATEST_VERSION_CACHE_FILE),
+        delete=False,
+    )
+    try:
+        with f:
+            f.write(latest_version)
+        os.replace(f.name, DEVSERVICES_LATEST_VERSION_CACHE_FILE)
+    except BaseException:
+        os.unlink(f.name)
+        raise
 
 
 def check_for_update() -> str | None:
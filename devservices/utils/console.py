@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import sys
 import threading
-import time
 from collections.abc import Callable
 from types import TracebackType
 
@@ -102,7 +101,8 @@ class Status:
             sys.stdout.write("\r" + ANIMATION_FRAMES[idx % len(ANIMATION_FRAMES)] + " ")
             sys.stdout.flush()
             idx += 1
-            time.sleep(0.1)
+            # Wake up as soon as stop() is called rather than at the end of a sleep
+            self._stop_loading.wait(0.1)
 
     def __enter__(self) -> Status:
         self.start()
@@ -461,18 +461,16 @@ def _update_dependency(
             branch=dependency.branch,
         ) from e
 
-    # Check if the local repo is up-to-date
-    local_commit = subprocess.check_output(
-        ["git", "rev-parse", "HEAD"],
-        cwd=dependency_repo_dir,
-        stderr=subprocess.PIPE,
-    ).strip()
-
-    remote_commit = subprocess.check_output(
-        ["git", "rev-parse", "FETCH_HEAD"],
-        cwd=dependency_repo_dir,
-        stderr=subprocess.PIPE,
-    ).strip()
+    # Check if the local repo is up-to-date, resolving both revisions in one process
+    local_commit, remote_commit = (
+        subprocess.check_output(
+            ["git", "rev-parse", "HEAD", "FETCH_HEAD"],
+            cwd=dependency_repo_dir,
+            stderr=subprocess.PIPE,
+        )
+        .strip()
+        .splitlines()
+    )
 
     if local_commit == remote_commit:
         # Already up-to-date, don't pull anything
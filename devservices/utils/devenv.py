@@ -4,11 +4,14 @@ import os
 from configparser import ConfigParser
 from configparser import NoOptionError
 from configparser import NoSectionError
+from functools import lru_cache
 
 from devenv.constants import home
 from devenv.lib.config import read_config
 
 
+# The devenv config doesn't change during a run, so read it once per process
+@lru_cache(maxsize=1)
 def get_coderoot() -> str:
     config_path = os.path.join(home, ".config", "sentry-devenv", "config.ini")
     try:
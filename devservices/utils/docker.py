@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import concurrent.futures
 import subprocess
 import time
+from functools import lru_cache
 
+from devservices.constants import HEALTHCHECK_INITIAL_INTERVAL
 from devservices.constants import HEALTHCHECK_INTERVAL
 from devservices.constants import HEALTHCHECK_TIMEOUT
 from devservices.exceptions import ContainerHealthcheckFailedError
@@ -12,6 +13,8 @@ from devservices.exceptions import DockerError
 from devservices.utils.console import Status
 
 
+# Only a successful check is cached, since lru_cache doesn't cache exceptions
+@lru_cache(maxsize=1)
 def check_docker_daemon_running() -> None:
     """Checks if the Docker daemon is running. Raises DockerDaemonNotRunningError if not."""
     try:
@@ -26,56 +29,64 @@ def check_docker_daemon_running() -> None:
 
 
 def check_all_containers_healthy(status: Status, containers: list[str]) -> None:
-    """Ensures all containers are healthy."""
-    with concurrent.futures.ThreadPoolExecutor() as healthcheck_executor:
-        futures = [
-            healthcheck_executor.submit(wait_for_healthy, container, status)
-            for container in containers
-        ]
-        for future in concurrent.futures.as_completed(futures):
-            future.result()
+    """
+    Polls the health status of the given containers until they are all healthy or a timeout is reached.
+    """
+    remaining_containers = list(containers)
+    start = time.time()
+    delay = HEALTHCHECK_INITIAL_INTERVAL
+    while remaining_containers and time.time() - start < HEALTHCHECK_TIMEOUT:
+        health_statuses = _get_health_statuses(remaining_containers)
+        unhealthy_containers = []
+        for container_name, health_status in zip(remaining_containers, health_statuses):
+            if health_status == "unknown":
+                status.warning(
+                    f"WARNING: Container {container_name} does not have a healthcheck"
+                )
+            elif health_status != "healthy":
+                unhealthy_containers.append(container_name)
+        remaining_containers = unhealthy_containers
+        if not remaining_containers:
+            return
+
+        # If not healthy, wait and try again, backing off exponentially up to the interval
+        time.sleep(delay)
+        delay = min(delay * 2, HEALTHCHECK_INTERVAL)
+
+    if remaining_containers:
+        raise ContainerHealthcheckFailedError(
+            remaining_containers[0], HEALTHCHECK_TIMEOUT
+        )
 
 
-def wait_for_healthy(container_name: str, status: Status) -> None:
+def _get_health_statuses(containers: list[str]) -> list[str]:
     """
-    Polls a Docker container's health status until it becomes healthy or a timeout is reached.
+    Returns the health status of each container, in order, using a single docker inspect call.
     """
-    start = time.time()
-    while time.time() - start < HEALTHCHECK_TIMEOUT:
-        # Run docker inspect to get the container's health status
-        try:
-            # For containers with no healthchecks, the output will be "unknown"
-            result = subprocess.check_output(
+    try:
+        # For containers with no healthchecks, the output will be "unknown"
+        return (
+            subprocess.check_output(
                 [
                     "docker",
                     "inspect",
                     "-f",
                     "{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}",
-                    container_name,
+                    *containers,
                 ],
                 stderr=subprocess.DEVNULL,
                 text=True,
-            ).strip()
-        except subprocess.CalledProcessError as e:
-            raise DockerError(
-                command=f"docker inspect -f '{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}' {container_name}",
-                returncode=e.returncode,
-                stdout=e.stdout,
-                stderr=e.stderr,
-            ) from e
-
-        if result == "healthy":
-            return
-        if result == "unknown":
-            status.warning(
-                f"WARNING: Container {container_name} does not have a healthcheck"
             )
-            return
-
-        # If not healthy, wait and try again
-        time.sleep(HEALTHCHECK_INTERVAL)
-
-    raise ContainerHealthcheckFailedError(container_name, HEALTHCHECK_TIMEOUT)
+            .strip()
+            .splitlines()
+        )
+    except subprocess.CalledProcessError as e:
+        raise DockerError(
+            command=f"docker inspect -f '{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}' {' '.join(containers)}",
+            returncode=e.returncode,
+            stdout=e.stdout,
+            stderr=e.stderr,
+        ) from e
 
 
 def get_matching_containers(label: str) -> list[str]:
@@ -257,10 +257,22 @@ def get_docker_compose_commands_to_run(
     return docker_compose_commands
 
 
-def run_cmd(cmd: list[str], env: dict[str, str]) -> subprocess.CompletedProcess[str]:
+def run_cmd(
+    cmd: list[str], env: dict[str, str], capture_stdout: bool = True
+) -> subprocess.CompletedProcess[str]:
     logger = logging.getLogger(LOGGER_NAME)
     try:
         logger.debug(f"Running command: {' '.join(cmd)}")
+        if not capture_stdout:
+            # Callers that ignore stdout only need stderr to report failures
+            return subprocess.run(
+                cmd,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=env,
+            )
         return subprocess.run(cmd, check=True, capture_output=True, text=True, env=env)
     except subprocess.CalledProcessError as e:
         raise DockerComposeError(
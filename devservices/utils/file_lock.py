@@ -2,23 +2,37 @@ from __future__ import annotations
 
 import contextlib
 import fcntl
+import threading
 from collections.abc import Generator
 
+# POSIX record locks (lockf) are owned by the process rather than the file
+# descriptor, so they don't exclude other threads of the same process. Closing
+# any descriptor of the file also drops the process' lock, so threads must be
+# serialized before the file is opened.
+_thread_locks: dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _get_thread_lock(path: str) -> threading.Lock:
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(path, threading.Lock())
+
 
 @contextlib.contextmanager
 def lock(path: str) -> Generator[None, None, None]:
-    with open(path, mode="a+", encoding="utf-8") as f:
-        with _locked(f.fileno()):
-            yield
+    with _get_thread_lock(path):
+        with open(path, mode="a+", encoding="utf-8") as f:
+            with _locked(f.fileno()):
+                yield
 
 
 @contextlib.contextmanager
 def _locked(fileno: int) -> Generator[None, None, None]:
     try:
-        fcntl.flock(fileno, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        fcntl.lockf(fileno, fcntl.LOCK_EX | fcntl.LOCK_NB)
     except OSError:
-        fcntl.flock(fileno, fcntl.LOCK_EX)
+        fcntl.lockf(fileno, fcntl.LOCK_EX)
     try:
         yield
     finally:
-        fcntl.flock(fileno, fcntl.LOCK_UN)
+        fcntl.lockf(fileno, fcntl.LOCK_UN)
@@ -1,24 +1,57 @@
 from __future__ import annotations
 
+import hashlib
 import os
-import shutil
 import tempfile
 import time
-from urllib.request import urlretrieve
+from urllib.error import ContentTooShortError
+from urllib.request import urlopen
 
 from devservices.constants import BINARY_PERMISSIONS
+from devservices.constants import DOWNLOAD_CHUNK_SIZE
 from devservices.exceptions import BinaryInstallError
 from devservices.utils.console import Console
 
 
+def _download_file(url: str, destination: str) -> str:
+    """Stream the response straight to disk, returning the SHA-256 hex digest."""
+    sha256 = hashlib.sha256()
+    size = 0
+    with urlopen(url) as response, open(destination, "wb") as f:
+        headers = response.headers
+        content_length = headers.get("Content-Length")
+        while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+            sha256.update(chunk)
+            f.write(chunk)
+            size += len(chunk)
+    # read() returns b"" when the connection drops early, so check for truncation
+    # the same way urlretrieve does
+    if content_length is not None and size < int(content_length):
+        raise ContentTooShortError(
+            f"retrieval incomplete: got only {size} out of {content_length} bytes",
+            (destination, headers),
+        )
+    return sha256.hexdigest()
+
+
 def install_binary(
     binary_name: str,
     exec_path: str,
     version: str,
     url: str,
+    expected_sha256: str | None = None,
 ) -> None:
     console = Console()
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # Download next to the destination so the final move is an atomic rename on
+    # the same filesystem
+    install_dir = os.path.dirname(os.path.abspath(exec_path))
+    try:
+        temp_dir_context = tempfile.TemporaryDirectory(dir=install_dir)
+    except OSError as e:
+        raise BinaryInstallError(
+            f"Failed to create a temporary directory in {install_dir}: {e}"
+        ) from e
+    with temp_dir_context as temp_dir:
         temp_file = os.path.join(temp_dir, binary_name)
 
         # Download the binary with retries
@@ -27,7 +60,7 @@ def install_binary(
         console.info(f"Downloading {binary_name} {version} from {url}...")
         for attempt in range(max_retries):
             try:
-                urlretrieve(url, temp_file)
+                sha256 = _download_file(url, temp_file)
                 break
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -40,6 +73,12 @@ def install_binary(
                         f"Failed to download {binary_name} after {max_retries} attempts: {e}"
                     ) from e
 
+        # No caller pins a digest yet, so this only runs when one is passed explicitly
+        if expected_sha256 is not None and sha256 != expected_sha256.lower():
+            raise BinaryInstallError(
+                f"Checksum mismatch for {binary_name}: expected {expected_sha256}, got {sha256}"
+            )
+
         # Make the binary executable
         try:
             os.chmod(temp_file, BINARY_PERMISSIONS)
@@ -49,7 +88,7 @@ def install_binary(
             ) from e
 
         try:
-            shutil.move(temp_file, exec_path)
+            os.replace(temp_file, exec_path)
         except (PermissionError, FileNotFoundError) as e:
             raise BinaryInstallError(
                 f"Failed to move {binary_name} binary to {exec_path}: {e}"
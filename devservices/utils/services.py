@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from devservices.configs.service_config import ServiceConfig
 from devservices.exceptions import ConfigNotFoundError
@@ -26,27 +27,41 @@ def get_local_services(coderoot: str) -> list[Service]:
     console = Console()
 
     services = []
-    for repo in os.listdir(coderoot):
-        repo_path = os.path.join(coderoot, repo)
-        try:
-            service_config = load_service_config_from_file(repo_path)
-        except (ConfigParseError, ConfigValidationError) as e:
-            console.warning(f"{repo} was found with an invalid config: {e}")
-            continue
-        except ConfigNotFoundError:
-            # Ignore repos that don't have devservices configs
-            continue
-        service_name = service_config.service_name
-        services.append(
-            Service(
-                name=service_name,
-                repo_path=repo_path,
-                config=service_config,
+    with os.scandir(coderoot) as entries:
+        for entry in entries:
+            # The entry type usually comes from the directory listing itself, so
+            # plain files are skipped without a stat or an attempt to open a config
+            if not entry.is_dir():
+                continue
+            repo_path = entry.path
+            try:
+                service_config = load_service_config_from_file(repo_path)
+            except (ConfigParseError, ConfigValidationError) as e:
+                console.warning(f"{entry.name} was found with an invalid config: {e}")
+                continue
+            except ConfigNotFoundError:
+                # Ignore repos that don't have devservices configs
+                continue
+            service_name = service_config.service_name
+            services.append(
+                Service(
+                    name=service_name,
+                    repo_path=repo_path,
+                    config=service_config,
+                )
             )
-        )
     return services
 
 
+@lru_cache(maxsize=1)
+def _get_local_services_by_name(coderoot: str) -> dict[str, Service]:
+    """Index the services in the coderoot by lowercase name, keeping the first match."""
+    services_by_name: dict[str, Service] = {}
+    for service in get_local_services(coderoot):
+        services_by_name.setdefault(service.name.lower(), service)
+    return services_by_name
+
+
 def find_matching_service(service_name: str | None = None) -> Service:
     """Find a service with the given name."""
     if service_name is None:
@@ -61,11 +76,13 @@ def find_matching_service(service_name: str | None = None) -> Service:
             config=service_config,
         )
     coderoot = get_coderoot()
-    services = get_local_services(coderoot)
-    for service in services:
-        if service.name.lower() == service_name.lower():
-            return service
-    unique_service_names = sorted(set(service.name for service in services))
+    services_by_name = _get_local_services_by_name(coderoot)
+    service = services_by_name.get(service_name.lower())
+    if service is not None:
+        return service
+    unique_service_names = sorted(
+        set(service.name for service in services_by_name.values())
+    )
     error_message = f"Service '{service_name}' not found."
     if len(unique_service_names) > 0:
         service_bullet_points = "\n".join(
@@ -89,7 +89,8 @@ def test_down_simple(
                 "redis",
             ],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             env=mock.ANY,
         )
@@ -247,7 +248,8 @@ def test_down_mode_simple(
                 "redis",
             ],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             env=mock.ANY,
         )
@@ -103,7 +103,8 @@ def test_up_simple(
                 "always",
             ],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             env=mock.ANY,
         )
@@ -362,7 +363,8 @@ def test_up_docker_compose_container_lookup_error(
                 "always",
             ],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             env=mock.ANY,
         )
@@ -467,7 +469,8 @@ def test_up_docker_compose_container_healthcheck_failed(
                 "always",
             ],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             env=mock.ANY,
         )
@@ -563,7 +566,8 @@ def test_up_mode_simple(
                 "always",
             ],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             env=mock.ANY,
         )
@@ -711,7 +715,8 @@ def test_up_mutliple_modes(
                         "always",
                     ],
                     check=True,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                     env=mock.ANY,
                 ),
@@ -843,6 +848,7 @@ def test_up_multiple_modes_overlapping_running_service(
                             "always",
                         ],
                         mock.ANY,
+                        capture_stdout=False,
                     ),
                 ],
             )
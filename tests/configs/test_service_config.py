@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import os
 from dataclasses import asdict
+from dataclasses import FrozenInstanceError
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
@@ -117,6 +120,82 @@ def test_load_service_config_from_file_missing_config(tmp_path: Path) -> None:
     )
 
 
+def test_load_service_config_from_file_repo_path_is_file(tmp_path: Path) -> None:
+    repo_path = tmp_path / "README.md"
+    repo_path.touch()
+    with pytest.raises(ConfigNotFoundError) as e:
+        load_service_config_from_file(str(repo_path))
+    assert (
+        str(e.value)
+        == f"No devservices configuration found in {repo_path / 'devservices' / 'config.yml'}"
+    )
+
+
+def test_load_service_config_from_file_permission_denied(tmp_path: Path) -> None:
+    with mock.patch(
+        "devservices.configs.service_config.os.stat",
+        side_effect=PermissionError(13, "Permission denied"),
+    ):
+        with pytest.raises(ConfigNotFoundError) as e:
+            load_service_config_from_file(str(tmp_path))
+    assert (
+        str(e.value)
+        == f"No devservices configuration found in {tmp_path / 'devservices' / 'config.yml'}"
+    )
+
+
+def test_load_service_config_from_file_reuses_unchanged_config(tmp_path: Path) -> None:
+    config = {
+        "x-sentry-service-config": {
+            "version": 0.1,
+            "service_name": "example-service",
+            "modes": {"default": []},
+        }
+    }
+    create_config_file(tmp_path, config)
+
+    first = load_service_config_from_file(str(tmp_path))
+    second = load_service_config_from_file(str(tmp_path))
+    assert first is second
+
+
+def test_load_service_config_from_file_reloads_modified_config(tmp_path: Path) -> None:
+    config = {
+        "x-sentry-service-config": {
+            "version": 0.1,
+            "service_name": "example-service",
+            "modes": {"default": []},
+        }
+    }
+    create_config_file(tmp_path, config)
+    first = load_service_config_from_file(str(tmp_path))
+
+    config["x-sentry-service-config"]["service_name"] = "other-service"
+    create_config_file(tmp_path, config)
+    config_path = tmp_path / "devservices" / "config.yml"
+    mtime_ns = config_path.stat().st_mtime_ns
+    os.utime(config_path, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+
+    second = load_service_config_from_file(str(tmp_path))
+    assert first.service_name == "example-service"
+    assert second.service_name == "other-service"
+
+
+def test_load_service_config_from_file_is_frozen(tmp_path: Path) -> None:
+    config = {
+        "x-sentry-service-config": {
+            "version": 0.1,
+            "service_name": "example-service",
+            "modes": {"default": []},
+        }
+    }
+    create_config_file(tmp_path, config)
+
+    service_config = load_service_config_from_file(str(tmp_path))
+    with pytest.raises(FrozenInstanceError):
+        service_config.service_name = "other-service"  # type: ignore[misc]
+
+
 def test_load_service_config_from_file_invalid_version(tmp_path: Path) -> None:
     config = {
         "x-sentry-service-config": {
@@ -306,9 +385,10 @@ def test_load_service_config_from_file_invalid_yaml(tmp_path: Path) -> None:
 
     with pytest.raises(ConfigParseError) as e:
         load_service_config_from_file(str(tmp_path))
-    assert (
-        str(e.value)
-        == f"Error parsing config file: mapping values are not allowed here\n  in \"{tmp_path / 'devservices' / 'config.yml'}\", line 2, column 12"
+    # libyaml and the pure Python loader word this error slightly differently
+    assert str(e.value) in (
+        f"Error parsing config file: mapping values are not allowed {context}\n  in \"{tmp_path / 'devservices' / 'config.yml'}\", line 2, column 12"
+        for context in ("here", "in this context")
     )
 
 
@@ -2,9 +2,33 @@ from __future__ import annotations
 
 import pytest
 
+from devservices.configs.service_config import _load_service_config
+from devservices.utils.devenv import get_coderoot
+from devservices.utils.docker import check_docker_daemon_running
+from devservices.utils.services import _get_local_services_by_name
 from devservices.utils.state import State
 
 
 @pytest.fixture(autouse=True)
 def clear_singleton_instance() -> None:
     State._instance = None
+
+
+@pytest.fixture(autouse=True)
+def clear_docker_daemon_check_cache() -> None:
+    check_docker_daemon_running.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_local_services_cache() -> None:
+    _get_local_services_by_name.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_service_config_cache() -> None:
+    _load_service_config.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_coderoot_cache() -> None:
+    get_coderoot.cache_clear()
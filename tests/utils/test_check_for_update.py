@@ -5,6 +5,7 @@ from datetime import timedelta
 from pathlib import Path
 from unittest import mock
 
+import pytest
 from freezegun import freeze_time
 
 from devservices.constants import DEVSERVICES_LATEST_VERSION_CACHE_TTL
@@ -40,6 +41,38 @@ def test_check_for_update_not_cached(mock_urlopen: mock.Mock, tmp_path: Path) ->
         with cached_file.open("r") as f:
             cached_version = f.read()
             assert cached_version == "1.0.0"
+        # The temporary file used for the atomic write is not left behind
+        assert list(cache_dir.iterdir()) == [cached_file]
+
+
+@mock.patch(
+    "devservices.utils.check_for_update.os.replace",
+    side_effect=OSError("No space left on device"),
+)
+@mock.patch("devservices.utils.check_for_update.urlopen")
+def test_check_for_update_cache_write_failure_cleans_up(
+    mock_urlopen: mock.Mock, mock_replace: mock.Mock, tmp_path: Path
+) -> None:
+    mock_response = mock.mock_open(read_data=b'{"tag_name": "1.0.0"}').return_value
+    mock_response.status = 200
+    mock_urlopen.side_effect = [mock_response]
+    cache_dir = tmp_path / "cache"
+    cached_file = cache_dir / "latest_version.txt"
+    with (
+        mock.patch(
+            "devservices.utils.check_for_update.DEVSERVICES_CACHE_DIR",
+            str(cache_dir),
+        ),
+        mock.patch(
+            "devservices.utils.check_for_update.DEVSERVICES_LATEST_VERSION_CACHE_FILE",
+            str(cached_file),
+        ),
+    ):
+        with pytest.raises(OSError, match="No space left on device"):
+            check_for_update()
+
+        mock_replace.assert_called_once()
+        assert list(cache_dir.iterdir()) == []
 
 
 @mock.patch("devservices.utils.check_for_update.urlopen")
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from configparser import ConfigParser
+from unittest import mock
+
+from devservices.utils.devenv import get_coderoot
+
+
+@mock.patch("devservices.utils.devenv.read_config")
+def test_get_coderoot_reads_config_once(mock_read_config: mock.Mock) -> None:
+    devenv_config = ConfigParser()
+    devenv_config.read_dict({"devenv": {"coderoot": "/code"}})
+    mock_read_config.return_value = devenv_config
+
+    assert get_coderoot() == "/code"
+    assert get_coderoot() == "/code"
+    mock_read_config.assert_called_once()
@@ -9,6 +9,7 @@ from freezegun import freeze_time
 
 from devservices.constants import DEVSERVICES_ORCHESTRATOR_LABEL
 from devservices.constants import DOCKER_NETWORK_NAME
+from devservices.constants import HEALTHCHECK_INITIAL_INTERVAL
 from devservices.constants import HEALTHCHECK_INTERVAL
 from devservices.constants import HEALTHCHECK_TIMEOUT
 from devservices.exceptions import ContainerHealthcheckFailedError
@@ -20,7 +21,6 @@ from devservices.utils.docker import get_matching_containers
 from devservices.utils.docker import get_matching_networks
 from devservices.utils.docker import get_volumes_for_containers
 from devservices.utils.docker import stop_containers
-from devservices.utils.docker import wait_for_healthy
 
 
 @mock.patch("subprocess.run")
@@ -47,6 +47,22 @@ def test_check_docker_daemon_running(mock_run: mock.Mock) -> None:
     )
 
 
+@mock.patch("subprocess.run")
+def test_check_docker_daemon_running_cached(mock_run: mock.Mock) -> None:
+    check_docker_daemon_running()
+    check_docker_daemon_running()
+    mock_run.assert_called_once()
+
+
+@mock.patch("subprocess.run")
+def test_check_docker_daemon_running_error_not_cached(mock_run: mock.Mock) -> None:
+    mock_run.side_effect = [subprocess.CalledProcessError(1, "cmd"), None]
+    with pytest.raises(DockerDaemonNotRunningError):
+        check_docker_daemon_running()
+    check_docker_daemon_running()
+    assert mock_run.call_count == 2
+
+
 @mock.patch("subprocess.check_output")
 @mock.patch("devservices.utils.docker.check_docker_daemon_running")
 def test_get_matching_containers(
@@ -313,54 +329,71 @@ def test_stop_containers_remove_error(
     )
 
 
-@mock.patch("devservices.utils.docker.subprocess.check_output", return_value="healthy")
-def test_wait_for_healthy_success(mock_check_output: mock.Mock) -> None:
+HEALTHCHECK_FORMAT = (
+    "{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}"
+)
+
+
+@mock.patch(
+    "devservices.utils.docker.subprocess.check_output",
+    return_value="healthy\nhealthy\n",
+)
+def test_check_all_containers_healthy_success(mock_check_output: mock.Mock) -> None:
     mock_status = mock.Mock()
-    wait_for_healthy("container1", mock_status)
+    check_all_containers_healthy(mock_status, ["container1", "container2"])
     mock_check_output.assert_called_once_with(
         [
             "docker",
             "inspect",
             "-f",
-            "{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}",
+            HEALTHCHECK_FORMAT,
             "container1",
+            "container2",
         ],
         stderr=subprocess.DEVNULL,
         text=True,
     )
+    mock_status.warning.assert_not_called()
     mock_status.failure.assert_not_called()
 
 
-@mock.patch("devservices.utils.docker.subprocess.check_output", return_value="unknown")
-def test_wait_for_healthy_no_healthcheck(mock_check_output: mock.Mock) -> None:
+@mock.patch("devservices.utils.docker.subprocess.check_output")
+def test_check_all_containers_healthy_no_containers(
+    mock_check_output: mock.Mock,
+) -> None:
     mock_status = mock.Mock()
-    wait_for_healthy("container1", mock_status)
-    mock_check_output.assert_called_once_with(
-        [
-            "docker",
-            "inspect",
-            "-f",
-            "{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}",
-            "container1",
-        ],
-        stderr=subprocess.DEVNULL,
-        text=True,
+    check_all_containers_healthy(mock_status, [])
+    mock_check_output.assert_not_called()
+
+
+@mock.patch(
+    "devservices.utils.docker.subprocess.check_output",
+    return_value="unknown\nhealthy\n",
+)
+def test_check_all_containers_healthy_no_healthcheck(
+    mock_check_output: mock.Mock,
+) -> None:
+    mock_status = mock.Mock()
+    check_all_containers_healthy(mock_status, ["container1", "container2"])
+    mock_check_output.assert_called_once()
+    mock_status.warning.assert_called_once_with(
+        "WARNING: Container container1 does not have a healthcheck"
     )
     mock_status.failure.assert_not_called()
 
 
 @mock.patch("devservices.utils.docker.subprocess.check_output")
 @mock.patch("devservices.utils.docker.time.sleep")
-def test_wait_for_healthy_initial_check_failed_then_success(
+def test_check_all_containers_healthy_only_polls_unhealthy_containers(
     mock_sleep: mock.Mock,
     mock_check_output: mock.Mock,
 ) -> None:
     mock_status = mock.Mock()
-    mock_check_output.side_effect = ["unhealthy", "healthy"]
+    mock_check_output.side_effect = ["healthy\nstarting\n", "healthy\n"]
 
-    with (freeze_time("2024-05-14 00:00:00") as frozen_time,):
+    with freeze_time("2024-05-14 00:00:00") as frozen_time:
         mock_sleep.side_effect = lambda _: frozen_time.tick(timedelta(seconds=1))
-        wait_for_healthy("container1", mock_status)
+        check_all_containers_healthy(mock_status, ["container1", "container2"])
 
     mock_check_output.assert_has_calls(
         [
@@ -369,125 +402,81 @@ def test_wait_for_healthy_initial_check_failed_then_success(
                     "docker",
                     "inspect",
                     "-f",
-                    "{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}",
+                    HEALTHCHECK_FORMAT,
                     "container1",
+                    "container2",
                 ],
                 stderr=subprocess.DEVNULL,
                 text=True,
             ),
             mock.call(
-                [
-                    "docker",
-                    "inspect",
-                    "-f",
-                    "{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}",
-                    "container1",
-                ],
+                ["docker", "inspect", "-f", HEALTHCHECK_FORMAT, "container2"],
                 stderr=subprocess.DEVNULL,
                 text=True,
             ),
         ]
     )
-    mock_sleep.assert_called_once_with(HEALTHCHECK_INTERVAL)
+    mock_sleep.assert_called_once_with(HEALTHCHECK_INITIAL_INTERVAL)
+    mock_status.failure.assert_not_called()
+
+
+@mock.patch("devservices.utils.docker.subprocess.check_output")
+@mock.patch("devservices.utils.docker.time.sleep")
+def test_check_all_containers_healthy_backs_off_up_to_interval(
+    mock_sleep: mock.Mock,
+    mock_check_output: mock.Mock,
+) -> None:
+    mock_status = mock.Mock()
+    mock_check_output.side_effect = ["unhealthy"] * 6 + ["healthy"]
+
+    with freeze_time("2024-05-14 00:00:00") as frozen_time:
+        mock_sleep.side_effect = lambda _: frozen_time.tick(timedelta(seconds=1))
+        check_all_containers_healthy(mock_status, ["container1"])
+
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [
+        HEALTHCHECK_INITIAL_INTERVAL,
+        HEALTHCHECK_INITIAL_INTERVAL * 2,
+        HEALTHCHECK_INITIAL_INTERVAL * 4,
+        HEALTHCHECK_INITIAL_INTERVAL * 8,
+        HEALTHCHECK_INTERVAL,
+        HEALTHCHECK_INTERVAL,
+    ]
     mock_status.failure.assert_not_called()
 
 
 @mock.patch("devservices.utils.docker.subprocess.check_output")
 @mock.patch("devservices.utils.docker.time.sleep")
-def test_wait_for_healthy_docker_error(
+def test_check_all_containers_healthy_docker_error(
     mock_sleep: mock.Mock,
     mock_check_output: mock.Mock,
 ) -> None:
     mock_status = mock.Mock()
     mock_check_output.side_effect = subprocess.CalledProcessError(1, "cmd")
     with pytest.raises(DockerError):
-        with freeze_time("2024-05-14 00:00:00") as frozen_time:
-            mock_sleep.side_effect = lambda _: frozen_time.tick(timedelta(seconds=1))
-            wait_for_healthy("container1", mock_status)
+        check_all_containers_healthy(mock_status, ["container1"])
     mock_check_output.assert_called_once_with(
-        [
-            "docker",
-            "inspect",
-            "-f",
-            "{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}",
-            "container1",
-        ],
+        ["docker", "inspect", "-f", HEALTHCHECK_FORMAT, "container1"],
         stderr=subprocess.DEVNULL,
         text=True,
     )
+    mock_sleep.assert_not_called()
 
 
 @mock.patch("devservices.utils.docker.subprocess.check_output")
 @mock.patch("devservices.utils.docker.time.sleep")
-def test_wait_for_healthy_healthcheck_failed(
+def test_check_all_containers_healthy_healthcheck_failed(
     mock_sleep: mock.Mock,
     mock_check_output: mock.Mock,
 ) -> None:
     mock_status = mock.Mock()
-    mock_check_output.return_value = "unhealthy"
+    mock_check_output.side_effect = ["healthy\nunhealthy\n", "unhealthy\n"]
     with freeze_time("2024-05-14 00:00:00") as frozen_time:
-        with pytest.raises(ContainerHealthcheckFailedError):
-            mock_sleep.side_effect = lambda _: frozen_time.tick(
-                timedelta(seconds=HEALTHCHECK_TIMEOUT / 2)
-            )
-            wait_for_healthy("container1", mock_status)
-    mock_check_output.assert_has_calls(
-        [
-            mock.call(
-                [
-                    "docker",
-                    "inspect",
-                    "-f",
-                    "{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}",
-                    "container1",
-                ],
-                stderr=subprocess.DEVNULL,
-                text=True,
-            ),
-            mock.call(
-                [
-                    "docker",
-                    "inspect",
-                    "-f",
-                    "{{if .State.Health}}{{.State.Health.Status}}{{else}}unknown{{end}}",
-                    "container1",
-                ],
-                stderr=subprocess.DEVNULL,
-                text=True,
-            ),
-        ]
-    )
-
-
-@mock.patch("devservices.utils.docker.wait_for_healthy")
-def test_check_all_containers_healthy_success(
-    mock_wait_for_healthy: mock.Mock,
-) -> None:
-    mock_status = mock.Mock()
-    mock_wait_for_healthy.side_effect = [None, None]
-    check_all_containers_healthy(mock_status, ["container1", "container2"])
-    mock_wait_for_healthy.assert_has_calls(
-        [
-            mock.call("container1", mock_status),
-            mock.call("container2", mock_status),
-        ]
-    )
-
-
-@mock.patch("devservices.utils.docker.wait_for_healthy")
-def test_check_all_containers_healthy_failure(
-    mock_wait_for_healthy: mock.Mock,
-) -> None:
-    mock_status = mock.Mock()
-    mock_wait_for_healthy.side_effect = [
-        None,
-        ContainerHealthcheckFailedError("container2", HEALTHCHECK_TIMEOUT),
-    ]
-    with pytest.raises(ContainerHealthcheckFailedError):
-        check_all_containers_healthy(mock_status, ["container1", "container2"])
-    mock_wait_for_healthy.assert_has_calls(
-        [
-            mock.call("container1", mock_status),
-            mock.call("container2", mock_status),
-        ]
-    )
+        mock_sleep.side_effect = lambda _: frozen_time.tick(
+            timedelta(seconds=HEALTHCHECK_TIMEOUT / 2)
+        )
+        with pytest.raises(
+            ContainerHealthcheckFailedError,
+            match=f"Container container2 did not become healthy within {HEALTHCHECK_TIMEOUT} seconds.",
+        ):
+            check_all_containers_healthy(mock_status, ["container1", "container2"])
+    assert mock_check_output.call_count == 2
@@ -135,18 +135,18 @@ def test_install_docker_compose_binary_install_error(
 
 @mock.patch("platform.system", return_value="Darwin")
 @mock.patch("platform.machine", return_value="arm64")
-@mock.patch("devservices.utils.install_binary.urlretrieve")
+@mock.patch("devservices.utils.install_binary._download_file")
 @mock.patch("devservices.utils.install_binary.os.chmod")
-@mock.patch("devservices.utils.install_binary.shutil.move")
+@mock.patch("devservices.utils.install_binary.os.replace")
 @mock.patch(
     "devservices.utils.docker_compose.subprocess.run",
     side_effect=Exception("Docker Compose failed"),
 )
 def test_install_docker_compose_compose_verification_error(
     _mock_subprocess_run: mock.Mock,
-    _mock_shutil_move: mock.Mock,
+    _mock_replace: mock.Mock,
     _mock_chmod: mock.Mock,
-    _mock_urlretrieve: mock.Mock,
+    _mock_download_file: mock.Mock,
     _mock_machine: mock.Mock,
     _mock_system: mock.Mock,
 ) -> None:
@@ -160,9 +160,9 @@ def test_install_docker_compose_compose_verification_error(
 @mock.patch("tempfile.TemporaryDirectory")
 @mock.patch("platform.system", return_value="Darwin")
 @mock.patch("platform.machine", return_value="arm64")
-@mock.patch("devservices.utils.install_binary.urlretrieve")
+@mock.patch("devservices.utils.install_binary._download_file")
 @mock.patch("devservices.utils.install_binary.os.chmod")
-@mock.patch("devservices.utils.install_binary.shutil.move")
+@mock.patch("devservices.utils.install_binary.os.replace")
 @mock.patch(
     "devservices.utils.docker_compose.subprocess.run",
     return_value=subprocess.CompletedProcess(
@@ -173,21 +173,24 @@ def test_install_docker_compose_compose_verification_error(
 )
 def test_install_docker_compose_macos_arm64(
     mock_subprocess_run: mock.Mock,
-    mock_shutil_move: mock.Mock,
+    mock_replace: mock.Mock,
     mock_chmod: mock.Mock,
-    mock_urlretrieve: mock.Mock,
+    mock_download_file: mock.Mock,
     _mock_machine: mock.Mock,
     _mock_system: mock.Mock,
     mock_tempdir: mock.Mock,
 ) -> None:
     mock_tempdir.return_value.__enter__.return_value = "tempdir"
     install_docker_compose()
-    mock_urlretrieve.assert_called_once_with(
+    mock_tempdir.assert_called_once_with(
+        dir=os.path.expanduser("~/.docker/cli-plugins")
+    )
+    mock_download_file.assert_called_once_with(
         "https://github.com/docker/compose/releases/download/v2.29.7/docker-compose-darwin-aarch64",
         "tempdir/docker-compose",
     )
     mock_chmod.assert_called_once_with("tempdir/docker-compose", 0o755)
-    mock_shutil_move.assert_called_once_with(
+    mock_replace.assert_called_once_with(
         "tempdir/docker-compose",
         os.path.expanduser("~/.docker/cli-plugins/docker-compose"),
     )
@@ -199,9 +202,9 @@ def test_install_docker_compose_macos_arm64(
 @mock.patch("tempfile.TemporaryDirectory")
 @mock.patch("platform.system", return_value="Linux")
 @mock.patch("platform.machine", return_value="x86_64")
-@mock.patch("devservices.utils.install_binary.urlretrieve")
+@mock.patch("devservices.utils.install_binary._download_file")
 @mock.patch("devservices.utils.install_binary.os.chmod")
-@mock.patch("devservices.utils.install_binary.shutil.move")
+@mock.patch("devservices.utils.install_binary.os.replace")
 @mock.patch(
     "devservices.utils.docker_compose.subprocess.run",
     return_value=subprocess.CompletedProcess(
@@ -212,21 +215,24 @@ def test_install_docker_compose_macos_arm64(
 )
 def test_install_docker_compose_linux_x86(
     mock_subprocess_run: mock.Mock,
-    mock_shutil_move: mock.Mock,
+    mock_replace: mock.Mock,
     mock_chmod: mock.Mock,
-    mock_urlretrieve: mock.Mock,
+    mock_download_file: mock.Mock,
     _mock_machine: mock.Mock,
     _mock_system: mock.Mock,
     mock_tempdir: mock.Mock,
 ) -> None:
     mock_tempdir.return_value.__enter__.return_value = "tempdir"
     install_docker_compose()
-    mock_urlretrieve.assert_called_once_with(
+    mock_tempdir.assert_called_once_with(
+        dir=os.path.expanduser("~/.docker/cli-plugins")
+    )
+    mock_download_file.assert_called_once_with(
         "https://github.com/docker/compose/releases/download/v2.29.7/docker-compose-linux-x86_64",
         "tempdir/docker-compose",
     )
     mock_chmod.assert_called_once_with("tempdir/docker-compose", 0o755)
-    mock_shutil_move.assert_called_once_with(
+    mock_replace.assert_called_once_with(
         "tempdir/docker-compose",
         os.path.expanduser("~/.docker/cli-plugins/docker-compose"),
     )
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from devservices.utils.file_lock import lock
+
+
+def test_lock_excludes_threads_in_same_process(tmp_path: Path) -> None:
+    lock_path = str(tmp_path / "test.lock")
+    active = 0
+    max_active = 0
+    counter_lock = threading.Lock()
+
+    def _hold_lock() -> None:
+        nonlocal active, max_active
+        with lock(lock_path):
+            with counter_lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.05)
+            with counter_lock:
+                active -= 1
+
+    threads = [threading.Thread(target=_hold_lock) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_active == 1
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import os
+from pathlib import Path
 from unittest import mock
+from urllib.error import ContentTooShortError
 
 import pytest
 
 from devservices.exceptions import BinaryInstallError
+from devservices.utils.install_binary import _download_file
 from devservices.utils.install_binary import install_binary
 
 
 @mock.patch(
-    "devservices.utils.install_binary.urlretrieve",
+    "devservices.utils.install_binary._download_file",
     side_effect=Exception("Connection error"),
 )
 def test_install_docker_compose_connection_error(
-    mock_urlretrieve: mock.Mock, capsys: pytest.CaptureFixture[str]
+    mock_download_file: mock.Mock, capsys: pytest.CaptureFixture[str]
 ) -> None:
     with pytest.raises(
         BinaryInstallError,
@@ -33,9 +39,9 @@ def test_install_docker_compose_connection_error(
         assert "Download failed. Retrying in 1 seconds... (Attempt 2/2)" in captured.out
 
 
-@mock.patch("devservices.utils.install_binary.urlretrieve")
+@mock.patch("devservices.utils.install_binary._download_file")
 def test_install_docker_compose_chmod_file_not_found_error(
-    mock_urlretrieve: mock.Mock,
+    mock_download_file: mock.Mock,
 ) -> None:
     with pytest.raises(
         BinaryInstallError,
@@ -49,11 +55,11 @@ def test_install_docker_compose_chmod_file_not_found_error(
         )
 
 
-@mock.patch("devservices.utils.install_binary.urlretrieve")
+@mock.patch("devservices.utils.install_binary._download_file")
 @mock.patch("devservices.utils.install_binary.os.chmod")
-def test_install_docker_compose_shutil_file_not_found_error(
+def test_install_docker_compose_move_file_not_found_error(
     mock_chmod: mock.Mock,
-    mock_urlretrieve: mock.Mock,
+    mock_download_file: mock.Mock,
 ) -> None:
     with pytest.raises(
         BinaryInstallError,
@@ -67,14 +73,14 @@ def test_install_docker_compose_shutil_file_not_found_error(
         )
 
 
-@mock.patch("devservices.utils.install_binary.urlretrieve")
+@mock.patch("devservices.utils.install_binary._download_file")
 @mock.patch(
     "devservices.utils.install_binary.os.chmod",
     side_effect=PermissionError("Insufficient Permissions"),
 )
 def test_install_docker_compose_chmod_permission_error(
     mock_chmod: mock.Mock,
-    mock_urlretrieve: mock.Mock,
+    mock_download_file: mock.Mock,
 ) -> None:
     with pytest.raises(
         BinaryInstallError,
@@ -88,16 +94,16 @@ def test_install_docker_compose_chmod_permission_error(
         )
 
 
-@mock.patch("devservices.utils.install_binary.urlretrieve")
+@mock.patch("devservices.utils.install_binary._download_file")
 @mock.patch("devservices.utils.install_binary.os.chmod")
 @mock.patch(
-    "devservices.utils.install_binary.shutil.move",
+    "devservices.utils.install_binary.os.replace",
     side_effect=PermissionError("Insufficient Permissions"),
 )
-def test_install_docker_compose_shutil_move_permission_error(
+def test_install_docker_compose_replace_permission_error(
     mock_chmod: mock.Mock,
-    mock_urlretrieve: mock.Mock,
-    mock_move: mock.Mock,
+    mock_download_file: mock.Mock,
+    mock_replace: mock.Mock,
 ) -> None:
     with pytest.raises(
         BinaryInstallError,
@@ -109,3 +115,117 @@ def test_install_docker_compose_shutil_move_permission_error(
             "1.0.0",
             "http:://example.com",
         )
+
+
+@mock.patch("devservices.utils.install_binary.urlopen")
+def test_download_file_streams_response_to_disk(
+    mock_urlopen: mock.Mock, tmp_path: Path
+) -> None:
+    response = io.BytesIO(b"binary-contents")
+    response.headers = {"Content-Length": "15"}  # type: ignore[attr-defined]
+    mock_urlopen.return_value.__enter__.return_value = response
+    destination = tmp_path / "binary-name"
+
+    sha256 = _download_file("http://example.com", str(destination))
+
+    mock_urlopen.assert_called_once_with("http://example.com")
+    assert destination.read_bytes() == b"binary-contents"
+    assert sha256 == hashlib.sha256(b"binary-contents").hexdigest()
+
+
+@mock.patch("devservices.utils.install_binary.urlopen")
+def test_download_file_truncated_response(
+    mock_urlopen: mock.Mock, tmp_path: Path
+) -> None:
+    response = io.BytesIO(b"binary-con")
+    response.headers = {"Content-Length": "100"}  # type: ignore[attr-defined]
+    mock_urlopen.return_value.__enter__.return_value = response
+    destination = tmp_path / "binary-name"
+
+    with pytest.raises(
+        ContentTooShortError,
+        match="retrieval incomplete: got only 10 out of 100 bytes",
+    ):
+        _download_file("http://example.com", str(destination))
+
+
+@mock.patch("devservices.utils.install_binary.time.sleep")
+@mock.patch("devservices.utils.install_binary.os.chmod")
+@mock.patch("devservices.utils.install_binary.urlopen")
+def test_install_binary_retries_truncated_download(
+    mock_urlopen: mock.Mock,
+    mock_chmod: mock.Mock,
+    mock_sleep: mock.Mock,
+    tmp_path: Path,
+) -> None:
+    responses = []
+    for _ in range(3):
+        response = io.BytesIO(b"binary-con")
+        response.headers = {"Content-Length": "100"}  # type: ignore[attr-defined]
+        responses.append(response)
+    mock_urlopen.return_value.__enter__.side_effect = responses
+    exec_path = tmp_path / "binary-name"
+
+    with pytest.raises(
+        BinaryInstallError,
+        match="Failed to download binary-name after 3 attempts: <urlopen error retrieval incomplete",
+    ):
+        install_binary("binary-name", str(exec_path), "1.0.0", "http://example.com")
+
+    assert mock_urlopen.call_count == 3
+    mock_chmod.assert_not_called()
+    assert not exec_path.exists()
+
+
+@mock.patch("devservices.utils.install_binary._download_file", return_value="abc123")
+@mock.patch("devservices.utils.install_binary.os.chmod")
+@mock.patch("devservices.utils.install_binary.os.replace")
+def test_install_binary_checksum_mismatch(
+    mock_replace: mock.Mock,
+    mock_chmod: mock.Mock,
+    mock_download_file: mock.Mock,
+) -> None:
+    with pytest.raises(
+        BinaryInstallError,
+        match="Checksum mismatch for binary-name: expected def456, got abc123",
+    ):
+        install_binary(
+            "binary-name",
+            "exec_path",
+            "1.0.0",
+            "http:://example.com",
+            expected_sha256="def456",
+        )
+    mock_chmod.assert_not_called()
+    mock_replace.assert_not_called()
+
+
+def test_install_binary_downloads_next_to_destination(tmp_path: Path) -> None:
+    exec_path = tmp_path / "bin" / "binary-name"
+    exec_path.parent.mkdir()
+
+    def _download(url: str, destination: str) -> str:
+        assert os.path.dirname(os.path.dirname(destination)) == str(exec_path.parent)
+        Path(destination).write_bytes(b"binary-contents")
+        return "abc123"
+
+    with mock.patch(
+        "devservices.utils.install_binary._download_file", side_effect=_download
+    ):
+        install_binary("binary-name", str(exec_path), "1.0.0", "http://example.com")
+
+    assert exec_path.read_bytes() == b"binary-contents"
+    assert list(exec_path.parent.iterdir()) == [exec_path]
+
+
+@mock.patch("devservices.utils.install_binary._download_file")
+def test_install_binary_destination_dir_not_writable(
+    mock_download_file: mock.Mock, tmp_path: Path
+) -> None:
+    exec_path = tmp_path / "missing" / "binary-name"
+    with pytest.raises(
+        BinaryInstallError,
+        match=f"Failed to create a temporary directory in {tmp_path / 'missing'}",
+    ):
+        install_binary("binary-name", str(exec_path), "1.0.0", "http://example.com")
+    mock_download_file.assert_not_called()
@@ -6,6 +6,7 @@ from unittest import mock
 
 import pytest
 
+from devservices.configs.service_config import load_service_config_from_file
 from devservices.configs.service_config import ServiceConfig
 from devservices.exceptions import ServiceNotFoundError
 from devservices.utils.services import find_matching_service
@@ -87,6 +88,40 @@ def test_get_local_services_skips_non_devservices_repos(tmp_path: Path) -> None:
         assert local_services[0].repo_path == str(mock_basic_repo_path)
 
 
+def test_get_local_services_skips_files(tmp_path: Path) -> None:
+    mock_code_root = tmp_path / "code"
+    os.makedirs(mock_code_root)
+    (mock_code_root / "README.md").touch()
+    mock_repo_path = mock_code_root / "basic"
+    create_mock_git_repo("basic_repo", mock_repo_path)
+
+    with mock.patch(
+        "devservices.configs.service_config.load_service_config_from_file",
+        wraps=load_service_config_from_file,
+    ) as mock_load_service_config_from_file:
+        local_services = get_local_services(str(mock_code_root))
+
+    assert [service.name for service in local_services] == ["basic"]
+    mock_load_service_config_from_file.assert_called_once_with(str(mock_repo_path))
+
+
+@pytest.mark.skipif(os.geteuid() == 0, reason="root ignores directory permissions")
+def test_get_local_services_skips_unreadable_repos(tmp_path: Path) -> None:
+    mock_code_root = tmp_path / "code"
+    os.makedirs(mock_code_root)
+    mock_repo_path = mock_code_root / "basic"
+    create_mock_git_repo("basic_repo", mock_repo_path)
+    mock_locked_repo_path = mock_code_root / "locked"
+    os.makedirs(mock_locked_repo_path)
+    os.chmod(mock_locked_repo_path, 0)
+    try:
+        local_services = get_local_services(str(mock_code_root))
+    finally:
+        os.chmod(mock_locked_repo_path, 0o700)
+
+    assert [service.name for service in local_services] == ["basic"]
+
+
 @mock.patch(
     "devservices.utils.services.get_local_services",
     return_value=[],
@@ -163,3 +198,29 @@ def test_find_matching_service_not_found_with_local_services(
         )
 
         mock_get_local_services.assert_called_once_with(str(mock_code_root))
+
+
+def test_find_matching_service_reuses_local_services(tmp_path: Path) -> None:
+    mock_code_root = tmp_path / "code"
+    os.makedirs(mock_code_root)
+    with (
+        mock.patch(
+            "devservices.utils.dependencies.DEVSERVICES_DEPENDENCIES_CACHE_DIR",
+            str(tmp_path / "dependency-dir"),
+        ),
+        mock.patch(
+            "devservices.utils.services.get_coderoot",
+            return_value=str(mock_code_root),
+        ),
+        mock.patch(
+            "devservices.utils.services.get_local_services",
+            wraps=get_local_services,
+        ) as mock_get_local_services,
+    ):
+        mock_repo_path = mock_code_root / "basic"
+        create_mock_git_repo("basic_repo", mock_repo_path)
+
+        assert find_matching_service("basic").repo_path == str(mock_repo_path)
+        assert find_matching_service("BASIC").repo_path == str(mock_repo_path)
+
+        mock_get_local_services.assert_called_once_with(str(mock_code_root))